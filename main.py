@@ -75,7 +75,7 @@ class ServerSubscriber:
 
         try:
             async with websockets.connect(self.uri) as ws:
-                logger.info(f"ServerSubscriber connected to {self.uri}")
+                logger.info("ServerSubscriber connected to %s", self.uri)
                 while not self._stop_event.is_set():
                     try:
                         text = await asyncio.wait_for(ws.recv(), timeout=1.0)
@@ -93,7 +93,7 @@ class ServerSubscriber:
                     if isinstance(msg, dict) and msg.get("type") == "agent_status":
                         agent_id = msg.get("agent_id")
                         status = msg.get("status")
-                        logger.info(f"Received agent_status: {agent_id}={status}")
+                        logger.info("Received agent_status: %s=%s", agent_id, status)
                         # Schedule cache clear on the GUI thread via view.root.after
                         try:
                             root = getattr(self.view, 'root', None)
@@ -105,7 +105,7 @@ class ServerSubscriber:
                         except Exception:
                             logger.exception("Failed handling agent_status")
         except Exception as e:
-            logger.exception(f"ServerSubscriber connection failed: {e}")
+            logger.exception("ServerSubscriber connection failed: %s", e)
 
 class SelectionDialog:
     """Dialog for selecting options without name/description requirements"""
@@ -400,12 +400,38 @@ def async_operation(func):
 
 class ConnectionPool:
     """Simple database connection pool"""
+    # Per-connection settings applied once to every connection the pool opens
+    PRAGMAS = (
+        "foreign_keys = ON",
+        "journal_mode = WAL",        # Write-Ahead Logging
+        "synchronous = NORMAL",      # Only fsync at WAL checkpoints
+        "temp_store = MEMORY",       # Memory temp storage
+        "cache_size = -65536",       # 64 MiB page cache (negative = KiB)
+        "mmap_size = 268435456",     # 256 MiB memory-mapped reads
+        "busy_timeout = 30000",      # Wait for locks instead of failing with SQLITE_BUSY
+    )
+
     def __init__(self, db_path: str, max_connections: int = 5):
         self.db_path = db_path
         self.connections = []
         self.max_connections = max_connections
         self.lock = threading.Lock()
 
+        # Dedicated writer connection: all writes are serialized through it so they
+        # never contend with each other, while pooled connections serve the readers
+        self._writer_conn = None
+        self._writer_lock = threading.RLock()
+
+    def _configure_connection(self, conn):
+        """Apply the pool's PRAGMA settings to a freshly opened connection"""
+        for pragma in self.PRAGMAS:
+            conn.execute(f"PRAGMA {pragma}")
+        return conn
+
+    def _connect(self, check_same_thread: bool = True):
+        """Open and configure a new connection"""
+        return self._configure_connection(sqlite3.connect(self.db_path, check_same_thread=check_same_thread))
+
     @contextmanager
     def get_connection(self):
         """Get connection from pool"""
@@ -414,13 +440,11 @@ class ConnectionPool:
             if self.connections:
                 conn = self.connections.pop()
             elif len(self.connections) < self.max_connections:
-                conn = sqlite3.connect(self.db_path)
-                conn.execute('PRAGMA foreign_keys = ON')
+                conn = self._connect()
 
         if not conn:
             # Fall back to direct connection
-            conn = sqlite3.connect(self.db_path)
-            conn.execute('PRAGMA foreign_keys = ON')
+            conn = self._connect()
 
         try:
             yield conn
@@ -434,6 +458,38 @@ class ConnectionPool:
                 else:
                     conn.close()
 
+    @contextmanager
+    def get_writer(self):
+        """Get the single writer connection, holding the writer lock for the duration"""
+        if self.db_path == ':memory:':
+            # Every in-memory connection is its own database; keep writes on the pooled one
+            with self.get_connection() as conn:
+                yield conn
+            return
+
+        with self._writer_lock:
+            if self._writer_conn is None:
+                # Guarded by the writer lock, so it can be shared with background threads
+                self._writer_conn = self._connect(check_same_thread=False)
+            conn = self._writer_conn
+            try:
+                yield conn
+            except Exception:
+                conn.rollback()
+                raise
+
+    def close(self):
+        """Close all pooled reader connections and the writer connection"""
+        with self.lock:
+            connections, self.connections = self.connections, []
+        for conn in connections:
+            conn.close()
+
+        with self._writer_lock:
+            if self._writer_conn is not None:
+                self._writer_conn.close()
+                self._writer_conn = None
+
 class CachedMCPDataModel:
     """Enhanced data model with caching and connection pooling"""
     def __init__(self, db_path: str = "multi-agent_mcp_context_manager.db"):
@@ -450,14 +506,10 @@ class CachedMCPDataModel:
 
     def init_database(self):
         """Initialize database with performance optimizations"""
-        with self.pool.get_connection() as conn:
+        with self.pool.get_writer() as conn:
             cursor = conn.cursor()
 
-            # Enable performance settings
-            cursor.execute('PRAGMA journal_mode = WAL')  # Write-Ahead Logging
-            cursor.execute('PRAGMA synchronous = NORMAL')  # Better performance
-            cursor.execute('PRAGMA cache_size = 10000')  # Larger cache
-            cursor.execute('PRAGMA temp_store = MEMORY')  # Memory temp storage
+            # Performance PRAGMAs are applied per connection by ConnectionPool
 
             # Create tables (simplified for space)
             cursor.execute('''
@@ -557,7 +609,7 @@ class CachedMCPDataModel:
         project_id = f"proj_{name.lower().replace(' ', '_').replace('-', '_')}"
         now = datetime.now().isoformat()
 
-        with self.pool.get_connection() as conn:
+        with self.pool.get_writer() as conn:
             cursor = conn.cursor()
             cursor.execute('INSERT INTO projects (id, name, description, created_at, updated_at) VALUES (?, ?, ?, ?, ?)',
                           (project_id, name, description, now, now))
@@ -565,7 +617,7 @@ class CachedMCPDataModel:
 
             # Clear cache to force refresh
             self.clear_cache()
-            logger.info(f"Created project asynchronously: {name}")
+            logger.info("Created project asynchronously: %s", name)
             return project_id
 
     def get_sessions(self, project_id: str = None) -> Dict:
@@ -641,7 +693,7 @@ class CachedMCPDataModel:
         team_id = f"team_{name.lower().replace(' ', '_').replace('-', '_')}"
         now = datetime.now().isoformat()
 
-        with self.pool.get_connection() as conn:
+        with self.pool.get_writer() as conn:
             cursor = conn.cursor()
             cursor.execute('INSERT INTO teams (id, name, session_id, description, created_at) VALUES (?, ?, ?, ?, ?)',
                           (team_id, name, session_id, description, now))
@@ -649,24 +701,24 @@ class CachedMCPDataModel:
 
             # Clear cache to force refresh
             self.clear_cache()
-            logger.info(f"Created team: {name}")
+            logger.info("Created team: %s", name)
             return team_id
 
     def assign_agents_to_team(self, agent_ids: List[str], team_id: str = None):
         """Assign multiple agents to a team or unassign them"""
-        with self.pool.get_connection() as conn:
+        with self.pool.get_writer() as conn:
             cursor = conn.cursor()
             for agent_id in agent_ids:
                 cursor.execute('UPDATE agents SET team_id = ? WHERE id = ?', (team_id, agent_id))
             conn.commit()
             self.clear_cache()
             action = f"assigned to team {team_id}" if team_id else "unassigned from teams"
-            logger.info(f"Bulk {action}: {len(agent_ids)} agents")
+            logger.info("Bulk %s: %d agents", action, len(agent_ids))
 
     def assign_agents_to_session(self, agent_ids: List[str], session_id: str = None):
         """Assign multiple agents to a session or disconnect them"""
         status = 'connected' if session_id else 'disconnected'
-        with self.pool.get_connection() as conn:
+        with self.pool.get_writer() as conn:
             cursor = conn.cursor()
             for agent_id in agent_ids:
                 cursor.execute('UPDATE agents SET session_id = ?, status = ? WHERE id = ?',
@@ -674,16 +726,16 @@ class CachedMCPDataModel:
             conn.commit()
             self.clear_cache()
             action = f"assigned to session {session_id}" if session_id else "disconnected"
-            logger.info(f"Bulk {action}: {len(agent_ids)} agents")
+            logger.info("Bulk %s: %d agents", action, len(agent_ids))
 
     def rename_agent(self, agent_id: str, new_name: str):
         """Rename an agent"""
-        with self.pool.get_connection() as conn:
+        with self.pool.get_writer() as conn:
             cursor = conn.cursor()
             cursor.execute('UPDATE agents SET name = ? WHERE id = ?', (new_name, agent_id))
             conn.commit()
             self.clear_cache()
-            logger.info(f"Renamed agent {agent_id} to {new_name}")
+            logger.info("Renamed agent %s to %s", agent_id, new_name)
 
 class LazyTreeView(ttk.Treeview):
     """Treeview with lazy loading for large datasets"""
@@ -731,6 +783,11 @@ class PerformantMCPView:
             except Exception:
                 logger.exception("Failed to start server subscriber")
 
+        # Last (projects, sessions, agents) snapshot shown in the project tree
+        self._project_data_cache = ({}, {}, {})
+        # Pending debounced search callback id
+        self._search_after_id = None
+
         # Data refresh flag
         self.refresh_pending = False
         self.last_refresh = datetime.now()
@@ -1130,7 +1187,7 @@ class PerformantMCPView:
         """Load children for tree item on demand"""
         # This would implement lazy loading of sessions and agents
         # For now, just a placeholder
-        logger.info(f"Lazy loading children for item: {parent_item}")
+        logger.info("Lazy loading children for item: %s", parent_item)
 
     def new_project_async(self):
         """Create project with unified dialog"""
@@ -1152,7 +1209,7 @@ class PerformantMCPView:
             project_id = f"proj_{name.lower().replace(' ', '_').replace('-', '_')}"
             now = datetime.now().isoformat()
 
-            with self.model.pool.get_connection() as conn:
+            with self.model.pool.get_writer() as conn:
                 cursor = conn.cursor()
                 cursor.execute('INSERT INTO projects (id, name, description, created_at, updated_at) VALUES (?, ?, ?, ?, ?)',
                               (project_id, name, description, now, now))
@@ -1300,7 +1357,7 @@ class PerformantMCPView:
             session_id = f"sess_{project_id}_{session_name.lower().replace(' ', '_').replace('-', '_')}"
             now = datetime.now().isoformat()
 
-            with self.model.pool.get_connection() as conn:
+            with self.model.pool.get_writer() as conn:
                 cursor = conn.cursor()
                 cursor.execute('INSERT INTO sessions (id, name, project_id, description, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)',
                               (session_id, session_name, project_id, description, now, now))
@@ -1589,39 +1646,41 @@ class PerformantMCPView:
     def execute_team_to_session_assignment(self, team_id, team_name, session_id, session_display):
         """Execute the team to session assignment logic"""
         try:
-            with self.model.pool.get_connection() as conn:
+            with self.model.pool.get_writer() as conn:
                 cursor = conn.cursor()
 
                 # Get all agents in the selected team
                 cursor.execute('SELECT id, name, session_id FROM agents WHERE team_id = ? AND deleted_at IS NULL', (team_id,))
                 team_agents = cursor.fetchall()
 
-                if not team_agents:
-                    messagebox.showwarning("Warning", f"No agents found in team '{team_name}'")
-                    return
-
-                # Get all agents currently connected to the target session (not in our team)
-                cursor.execute('SELECT id, name, team_id FROM agents WHERE session_id = ? AND team_id != ? AND deleted_at IS NULL',
-                             (session_id, team_id))
-                current_session_agents = cursor.fetchall()
-
                 disconnected_count = 0
                 connected_count = 0
 
-                # First, disconnect all agents currently in the target session (not from our team)
-                for agent_id, agent_name, agent_team_id in current_session_agents:
-                    cursor.execute('UPDATE agents SET session_id = NULL, updated_at = ? WHERE id = ?',
-                                 (datetime.now().isoformat(), agent_id))
-                    disconnected_count += 1
-
-                # Then, connect all team agents to the target session
-                for agent_id, agent_name, current_session_id in team_agents:
-                    if current_session_id != session_id:  # Only update if not already connected
-                        cursor.execute('UPDATE agents SET session_id = ?, updated_at = ? WHERE id = ?',
-                                     (session_id, datetime.now().isoformat(), agent_id))
-                        connected_count += 1
-
-                conn.commit()
+                if team_agents:
+                    # Get all agents currently connected to the target session (not in our team)
+                    cursor.execute('SELECT id, name, team_id FROM agents WHERE session_id = ? AND team_id != ? AND deleted_at IS NULL',
+                                 (session_id, team_id))
+                    current_session_agents = cursor.fetchall()
+
+                    # First, disconnect all agents currently in the target session (not from our team)
+                    for agent_id, agent_name, agent_team_id in current_session_agents:
+                        cursor.execute('UPDATE agents SET session_id = NULL, updated_at = ? WHERE id = ?',
+                                     (datetime.now().isoformat(), agent_id))
+                        disconnected_count += 1
+
+                    # Then, connect all team agents to the target session
+                    for agent_id, agent_name, current_session_id in team_agents:
+                        if current_session_id != session_id:  # Only update if not already connected
+                            cursor.execute('UPDATE agents SET session_id = ?, updated_at = ? WHERE id = ?',
+                                         (session_id, datetime.now().isoformat(), agent_id))
+                            connected_count += 1
+
+                    conn.commit()
+
+            # Warn outside the writer block so the dialog doesn't hold the writer
+            if not team_agents:
+                messagebox.showwarning("Warning", f"No agents found in team '{team_name}'")
+                return
 
             # Clear cache and refresh
             self.model.clear_cache()
@@ -1782,7 +1841,7 @@ class PerformantMCPView:
             agent_id = f"agent_{name.lower().replace(' ', '_').replace('-', '_')}"
             now = datetime.now().isoformat()
 
-            with self.model.pool.get_connection() as conn:
+            with self.model.pool.get_writer() as conn:
                 cursor = conn.cursor()
                 cursor.execute('INSERT INTO agents (id, name, status, last_active) VALUES (?, ?, ?, ?)',
                               (agent_id, name, 'disconnected', now))
@@ -2047,7 +2106,7 @@ class PerformantMCPView:
         # Clear and repopulate tree
         self.agent_tree.delete(*self.agent_tree.get_children())
         for sort_key, agent_id, values in items:
-            self.agent_tree.insert('', tk.END, text=agent_id, values=values)
+            self.agent_tree.insert('', tk.END, iid=agent_id, text=agent_id, values=values)
 
         # Update column heading to show sort direction
         direction = ' ↓' if self.agent_sort_reverse else ' ↑'
@@ -2061,13 +2120,29 @@ class PerformantMCPView:
         current_text = {'name': 'Name', 'session': 'Session', 'team': 'Team', 'status': 'Status'}[column]
         self.agent_tree.heading(column, text=current_text + direction, command=lambda: self.sort_agents(column))
 
+    def sync_tree_rows(self, tree, rows):
+        """Update a flat treeview in place from (iid, text, values) rows.
+
+        Rows that disappeared are deleted, new ids are inserted and existing items are
+        updated and moved into position, so a refresh only touches what changed instead
+        of destroying and recreating every row (and selection survives the refresh).
+        """
+        existing = set(tree.get_children())
+        wanted = {iid for iid, _, _ in rows}
+        stale = existing - wanted
+        if stale:
+            tree.delete(*stale)
+
+        for index, (iid, text, values) in enumerate(rows):
+            if iid in existing:
+                tree.item(iid, text=text, values=values)
+                tree.move(iid, '', index)
+            else:
+                tree.insert('', index, iid=iid, text=text, values=values)
+
     def load_agent_data(self):
         """Load and display agent data"""
         try:
-            # Clear existing items
-            for item in self.agent_tree.get_children():
-                self.agent_tree.delete(item)
-
             agents = self.model.get_agents()
             sessions = self.model.get_sessions()
             teams = self.model.get_teams()
@@ -2086,7 +2161,8 @@ class PerformantMCPView:
 
             # Note: Teams are independent of sessions - agents belong to teams regardless of session
 
-            # Add agents to tree
+            # Build agent rows and apply them to the tree as a diff
+            rows = []
             for agent_id, agent in agents.items():
                 session_name = ""
                 team_name = ""
@@ -2101,10 +2177,11 @@ class PerformantMCPView:
                     if team:
                         team_name = team['name']
 
-                self.agent_tree.insert('', tk.END, text=agent_id,
-                                     values=(agent['name'], session_name, team_name, agent['status']))
+                rows.append((agent_id, agent_id, (agent['name'], session_name, team_name, agent['status'])))
+
+            self.sync_tree_rows(self.agent_tree, rows)
 
-            logger.info(f"Loaded {len(agents)} agents")
+            logger.info("Loaded %d agents", len(agents))
 
         except Exception as e:
             logger.error(f"Failed to load agent data: {e}")
@@ -2113,10 +2190,6 @@ class PerformantMCPView:
     def load_team_data(self):
         """Load and display team data"""
         try:
-            # Clear existing items
-            for item in self.team_tree.get_children():
-                self.team_tree.delete(item)
-
             teams = self.model.get_teams()
             sessions = self.model.get_sessions()
             agents = self.model.get_agents()
@@ -2140,14 +2213,16 @@ class PerformantMCPView:
                 self.team_agents_session_combo['values'] = session_options
 
             # Add teams to tree (no session column - teams are independent of sessions)
+            rows = []
             for team_id, team in teams.items():
                 agent_count = team_agent_counts.get(team_id, 0)
                 created_date = team['created_at'][:10] if team['created_at'] else ""
 
-                self.team_tree.insert('', tk.END, text=team_id,
-                                    values=(team['name'], agent_count, created_date))
+                rows.append((team_id, team_id, (team['name'], agent_count, created_date)))
+
+            self.sync_tree_rows(self.team_tree, rows)
 
-            logger.info(f"Loaded {len(teams)} teams")
+            logger.info("Loaded %d teams", len(teams))
 
         except Exception as e:
             logger.error(f"Failed to load team data: {e}")
@@ -2198,23 +2273,23 @@ class PerformantMCPView:
             return
 
         try:
-            with self.model.pool.get_connection() as conn:
+            with self.model.pool.get_writer() as conn:
                 cursor = conn.cursor()
 
                 # Get all agents in this team and update their sessions (keep team membership)
                 cursor.execute('SELECT id, name FROM agents WHERE team_id = ? AND deleted_at IS NULL', (team_id,))
                 team_agents = cursor.fetchall()
 
-                if not team_agents:
-                    messagebox.showwarning("Warning", "No agents found in selected team")
-                    return
-
                 for agent_id, agent_name in team_agents:
                     cursor.execute('UPDATE agents SET session_id = ?, updated_at = ? WHERE id = ?',
                                  (session_id, datetime.now().isoformat(), agent_id))
 
                 conn.commit()
 
+            if not team_agents:
+                messagebox.showwarning("Warning", "No agents found in selected team")
+                return
+
             # Clear cache and refresh
             self.model.clear_cache()
             self.load_team_data()
@@ -2256,13 +2331,16 @@ class PerformantMCPView:
                 cursor.execute('SELECT id, name FROM agents WHERE team_id = ? AND deleted_at IS NULL', (team_id,))
                 team_agents = cursor.fetchall()
 
-                if not team_agents:
-                    messagebox.showwarning("Warning", "No agents found in selected team")
-                    return
+            if not team_agents:
+                messagebox.showwarning("Warning", "No agents found in selected team")
+                return
 
-                if not messagebox.askyesno("Confirm",
-                                         f"Disconnect all {len(team_agents)} agents from team '{team['name']}' from their sessions?"):
-                    return
+            if not messagebox.askyesno("Confirm",
+                                     f"Disconnect all {len(team_agents)} agents from team '{team['name']}' from their sessions?"):
+                return
+
+            with self.model.pool.get_writer() as conn:
+                cursor = conn.cursor()
 
                 # Disconnect all team agents from sessions (keep team membership)
                 for agent_id, agent_name in team_agents:
@@ -2327,7 +2405,7 @@ class PerformantMCPView:
         # Clear and repopulate tree
         self.team_tree.delete(*self.team_tree.get_children())
         for sort_key, team_id, values in items:
-            self.team_tree.insert('', tk.END, text=team_id, values=values)
+            self.team_tree.insert('', tk.END, iid=team_id, text=team_id, values=values)
 
         # Update column heading to show sort direction
         direction = ' ↓' if self.team_sort_reverse else ' ↑'
@@ -2351,67 +2429,92 @@ class PerformantMCPView:
             sessions = self.model.get_sessions()
             agents = self.model.get_agents()
 
-            # Clear existing items
-            self.project_tree.delete(*self.project_tree.get_children())
+            # Keep the last fetched data so search can re-filter without hitting the database
+            self._project_data_cache = (projects, sessions, agents)
+            self.populate_project_tree(projects, sessions, agents, self.search_var.get().strip().lower())
 
-            # Group sessions by project
-            project_sessions = {}
-            for session_id, session in sessions.items():
-                project_id = session['project_id']
-                if project_id not in project_sessions:
-                    project_sessions[project_id] = []
-                project_sessions[project_id].append(session)
-
-            # Group agents by session
-            session_agents = {}
-            for agent_id, agent in agents.items():
-                session_id = agent['session_id']
-                if session_id:
-                    if session_id not in session_agents:
-                        session_agents[session_id] = []
-                    session_agents[session_id].append(agent)
-
-            # Add projects with their sessions and agents
-            for project_id, project in projects.items():
-                project_node = self.project_tree.insert('', tk.END, text=f"📁 {project['name']}",
-                                                       values=('project', project_id))
-
-                # Add sessions for this project
-                project_session_list = project_sessions.get(project_id, [])
-                for session in project_session_list:
-                    session_agent_list = session_agents.get(session['id'], [])
-                    agent_count = len(session_agent_list)
-
-                    session_text = f"🔧 {session['name']} ({agent_count} agents)"
-                    session_node = self.project_tree.insert(project_node, tk.END, text=session_text,
-                                                           values=('session', session['id']))
-
-                    # Add agents for this session
-                    for agent in session_agent_list:
-                        status_icon = "🟢" if agent['status'] == 'connected' else "🔴"
-                        agent_text = f"{status_icon} {agent['name']}"
-                        self.project_tree.insert(session_node, tk.END, text=agent_text,
-                                               values=('agent', agent['id']))
-
-            # Expand all project nodes to show sessions
-            for item in self.project_tree.get_children():
-                self.project_tree.item(item, open=True)
-
-            logger.info(f"Loaded {len(projects)} projects, {len(sessions)} sessions, {len(agents)} agents")
+            logger.info("Loaded %d projects, %d sessions, %d agents", len(projects), len(sessions), len(agents))
 
         except Exception as e:
             logger.error(f"Failed to load project data: {e}")
             messagebox.showerror("Error", f"Failed to load data: {e}")
 
-    def on_search(self, event=None):
-        """Handle search functionality"""
-        search_term = self.search_var.get().lower()
-        if not search_term:
-            return
+    def populate_project_tree(self, projects, sessions, agents, search_term=""):
+        """Rebuild the project tree, keeping only nodes that match search_term (or contain a match)"""
+        # Clear existing items
+        self.project_tree.delete(*self.project_tree.get_children())
 
-        # Simple search implementation
-        # In a full implementation, this would search through all data
-        self.status_var.set(f"Searching for: {search_term}")
+        # Group sessions by project
+        project_sessions = {}
+        for session_id, session in sessions.items():
+            project_id = session['project_id']
+            if project_id not in project_sessions:
+                project_sessions[project_id] = []
+            project_sessions[project_id].append(session)
+
+        # Group agents by session
+        session_agents = {}
+        for agent_id, agent in agents.items():
+            session_id = agent['session_id']
+            if session_id:
+                if session_id not in session_agents:
+                    session_agents[session_id] = []
+                session_agents[session_id].append(agent)
+
+        # Add projects with their sessions and agents
+        for project_id, project in projects.items():
+            project_match = not search_term or search_term in project['name'].lower()
+            project_node = None
+
+            # Add sessions for this project
+            project_session_list = project_sessions.get(project_id, [])
+            for session in project_session_list:
+                session_agent_list = session_agents.get(session['id'], [])
+                agent_count = len(session_agent_list)
+
+                session_match = project_match or search_term in session['name'].lower()
+                visible_agents = session_agent_list if session_match else [
+                    a for a in session_agent_list if search_term in a['name'].lower()]
+                if not session_match and not visible_agents:
+                    continue
+
+                if project_node is None:
+                    project_node = self.project_tree.insert('', tk.END, text=f"📁 {project['name']}",
+                                                           values=('project', project_id), open=True)
+
+                session_text = f"🔧 {session['name']} ({agent_count} agents)"
+                session_node = self.project_tree.insert(project_node, tk.END, text=session_text,
+                                                       values=('session', session['id']),
+                                                       open=bool(search_term))
+
+                # Add agents for this session
+                for agent in visible_agents:
+                    status_icon = "🟢" if agent['status'] == 'connected' else "🔴"
+                    agent_text = f"{status_icon} {agent['name']}"
+                    self.project_tree.insert(session_node, tk.END, text=agent_text,
+                                           values=('agent', agent['id']))
+
+            if project_node is None and project_match:
+                self.project_tree.insert('', tk.END, text=f"📁 {project['name']}",
+                                         values=('project', project_id), open=True)
+
+    def on_search(self, event=None):
+        """Debounce search keystrokes so a burst of typing triggers a single tree rebuild"""
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(150, self.apply_search)
+
+    def apply_search(self):
+        """Filter the project tree against the cached data (no database round-trip per keystroke)"""
+        self._search_after_id = None
+        search_term = self.search_var.get().strip().lower()
+        projects, sessions, agents = self._project_data_cache
+        self.populate_project_tree(projects, sessions, agents, search_term)
+
+        if search_term:
+            self.status_var.set(f"Searching for: {search_term}")
+        else:
+            self.status_var.set("Ready")
 
     def update_performance_stats(self):
         """Update performance statistics"""
@@ -80,7 +80,7 @@ async def run_db_write_with_backoff(fn, *args, **kwargs):
             last_exc = e
             msg = str(e).lower()
             if "locked" in msg or "busy" in msg:
-                logger.warning(f"DB busy; retrying after {int(delay*1000)}ms: {e}")
+                logger.warning("DB busy; retrying after %dms: %s", int(delay * 1000), e)
                 await asyncio.sleep(delay)
                 continue
             raise
@@ -103,14 +103,19 @@ def run_db_write_with_backoff_sync(fn, *args, **kwargs):
             last_exc = e
             msg = str(e).lower()
             if "locked" in msg or "busy" in msg:
-                logger.warning(f"DB busy; retrying after {int(delay*1000)}ms: {e}")
+                logger.warning("DB busy; retrying after %dms: %s", int(delay * 1000), e)
                 time.sleep(delay)
                 continue
             raise
     raise last_exc
 
+# journal_mode is persisted in the database file, so WAL only needs to be switched on once
+_wal_enabled = False
+
+
 @contextmanager
 def get_connection():
+    global _wal_enabled
     conn = sqlite3.connect(DB_PATH)
     conn.row_factory = sqlite3.Row
     try:
@@ -118,8 +123,10 @@ def get_connection():
         # Enable foreign keys, WAL mode and a busy timeout so writers retry instead of failing immediately
         try:
             conn.execute("PRAGMA foreign_keys = ON")
-            conn.execute("PRAGMA journal_mode = WAL")
             conn.execute("PRAGMA busy_timeout = 5000")
+            if not _wal_enabled:
+                conn.execute("PRAGMA journal_mode = WAL")
+                _wal_enabled = True
         except Exception:
             # If PRAGMA fails for any reason, continue with the connection (best-effort)
             logger.exception("Failed to set PRAGMA on connection")
@@ -163,14 +170,14 @@ class ConnectionManager:
         await websocket.accept()
         async with self.lock:
             self.active_connections[client_id] = websocket
-        logger.info(f"Client connected: {client_id}")
+        logger.info("Client connected: %s", client_id)
 
     async def disconnect(self, client_id: str):
         async with self.lock:
             ws = self.active_connections.pop(client_id, None)
             if ws:
                 await ws.close()
-        logger.info(f"Client disconnected: {client_id}")
+        logger.info("Client disconnected: %s", client_id)
 
     async def send_json(self, client_id: str, message: Dict[str, Any]):
         ws = self.active_connections.get(client_id)
@@ -212,7 +219,7 @@ async def writer_worker():
             if fut and not fut.done():
                 fut.set_result(result)
         except Exception as e:
-            logger.exception(f"Writer worker failed for job {fn}: {e}")
+            logger.exception("Writer worker failed for job %s: %s", fn, e)
             if fut and not fut.done():
                 fut.set_exception(e)
         finally:
@@ -279,7 +286,7 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
             except Exception:
                 msg = {"type": "raw", "payload": data}
 
-            logger.info(f"Received from {client_id}: {msg}")
+            logger.info("Received from %s: %s", client_id, msg)
 
             # Very small example: if client asks for latest contexts for an agent
             if isinstance(msg, dict) and msg.get("type") == "request_contexts":
@@ -302,7 +309,7 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
 
                 # Enforce allowlist if configured
                 if not _is_agent_allowed(agent_id):
-                    logger.info(f"Rejected announce from non-allowlisted agent: {agent_id}")
+                    logger.info("Rejected announce from non-allowlisted agent: %s", agent_id)
                     try:
                         await manager.send_json(client_id, {"type": "announce_rejected", "agent_id": agent_id, "reason": "not_allowlisted"})
                     except Exception:
@@ -330,7 +337,7 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
                 try:
                     await enqueue_write(upsert_agent, agent_id, name)
                 except Exception as e:
-                    logger.exception(f"Failed to persist announce for {agent_id}: {e}")
+                    logger.exception("Failed to persist announce for %s: %s", agent_id, e)
                 # Also notify other clients about agent connect
                 await manager.broadcast({"type": "agent_status", "agent_id": agent_id, "status": "connected"})
                 # Echo acknowledgement
@@ -343,7 +350,7 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
     except WebSocketDisconnect:
         await manager.disconnect(client_id)
     except Exception as e:
-        logger.exception(f"WebSocket error for {client_id}: {e}")
+        logger.exception("WebSocket error for %s: %s", client_id, e)
         await manager.disconnect(client_id)
 
 # Health check